@@ -1,4 +1,5 @@
 from graph_examples.linked_lists.base_lists import (
+    BaseArrayLinkedList,
     BaseCircularLinkedList,
     BaseDoublyLinkedList,
     BaseLinearLinkedList,
@@ -11,10 +12,13 @@ from graph_examples.linked_lists.base_nodes import (
     BaseLinkedNode,
 )
 from graph_examples.linked_lists.lists import (
+    ArrayDoublyLinkedList,
+    ArrayLinkedList,
     CircularDoublyLinkedList,
     CircularLinkedList,
     DoublyLinkedList,
     LinkedList,
+    UnrolledLinkedList,
 )
 from graph_examples.linked_lists.nodes import (
     CircularDoublyLinkedNode,
@@ -1,25 +1,47 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from array import array
 from collections.abc import Collection, Iterable, Reversible, Iterator
 from typing import Optional
 
 from graph_examples.linked_lists.base_nodes import BaseLinearLinkedNode, BaseCircularLinkedNode, T
 
+_EMPTY = object()  # Fills freed value slots in array backed lists. It's equal to nothing else.
+_INDEX_TYPECODE = 'q'  # Links in array backed lists are 8 byte ints. Memory runs out long before their range does.
+
 
 class BaseLinkedList(ABC, Collection[T]):
+    # _length is kept up to date by __init__ and the mutators, so len() is O(1).
+    __slots__ = ('_length',)
+
     # noinspection PyUnusedLocal
     @abstractmethod
     def __init__(self, values: Iterable[T] = ()) -> None:
         pass
 
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def __len__(self) -> int:
+        return self._length
+
     def __repr__(self) -> str:
-        return f'{self.__class__.__name__}({repr([x for x in self])})'
+        return f"{self.__class__.__name__}([{', '.join(map(repr, self))}])"
 
     @abstractmethod
     def appendleft(self, value: T) -> None:
         pass
 
+    @abstractmethod
+    def extend(self, values: Iterable[T]) -> None:
+        pass
+
+    def extendleft(self, values: Iterable[T]) -> None:
+        """Appendleft each of the values. Like deque.extendleft, this leaves them in reverse order."""
+        for value in values:
+            self.appendleft(value)
+
     @abstractmethod
     def popleft(self) -> T:
         pass
@@ -30,10 +52,12 @@ class BaseLinkedList(ABC, Collection[T]):
 
 
 class BaseSinglyLinkedList(BaseLinkedList[T], ABC):
-    pass
+    __slots__ = ()
 
 
 class BaseDoublyLinkedList(BaseLinkedList[T], ABC, Reversible):
+    __slots__ = ()
+
     @abstractmethod
     def pop(self) -> T:
         pass
@@ -42,21 +66,18 @@ class BaseDoublyLinkedList(BaseLinkedList[T], ABC, Reversible):
     def append(self, value: T) -> None:
         pass
 
+    def extend(self, values: Iterable[T]) -> None:
+        """Append each of the values."""
+        if values is self:
+            values = list(values)  # Like deque, copy first, or the loop would never run out of values.
+        for value in values:
+            self.append(value)
+
 
 class BaseLinearLinkedList(BaseLinkedList, ABC):
+    __slots__ = ('head',)
     head: Optional[BaseLinearLinkedNode[T]]
 
-    def __bool__(self) -> bool:
-        return self.head is not None
-
-    def __len__(self) -> int:
-        length = 0
-        node = self.head
-        while node is not None:
-            node = node.next
-            length += 1
-        return length
-
     def __iter__(self) -> Iterator[T]:
         node = self.head
         while node is not None:
@@ -66,63 +87,120 @@ class BaseLinearLinkedList(BaseLinkedList, ABC):
     def __contains__(self, value: T) -> bool:
         node = self.head
         while node is not None:
-            if node.value == value:
+            if node.value is value or node.value == value:
                 return True
             node = node.next
         return False
 
 
 class BaseCircularLinkedList(BaseLinkedList[T], ABC):
+    __slots__ = ('tail',)
     tail: Optional[BaseCircularLinkedNode[T]]
-    head: Optional[BaseCircularLinkedNode[T]]
-
-    def __bool__(self) -> bool:
-        return self.tail is not None
 
-    def __len__(self) -> int:
-        if not self:
-            return 0
-        length = 1
-        node = self.head
-        while node is not self.tail:
-            length += 1
-            node = node.next
-        return length
+    @property
+    def head(self) -> BaseCircularLinkedNode[T]:
+        """The node after the tail. Only the tail is stored, so internally prefer tail.next."""
+        return self.tail.next
 
     def __iter__(self) -> Iterator[T]:
-        if not self:
+        tail = self.tail
+        if tail is None:
             return
-        head = self.head
-        yield head.value
-        node = head.next
-        while node is not head:
+        node = tail.next
+        while node is not tail:
             yield node.value
             node = node.next
+        yield tail.value
 
     def infinite_iterator(self):
-        if not self:
+        tail = self.tail
+        if tail is None:
             return
-        node = self.head
+        node = tail.next
         while True:
             yield node.value
             node = node.next
 
     def __contains__(self, value: T) -> bool:
-        if not self:
+        tail = self.tail
+        if tail is None:
             return False
-        node = self.head
-        while node is not self.tail:
-            if node.value == value:
+        node = tail.next
+        while node is not tail:
+            if node.value is value or node.value == value:
                 return True
             node = node.next
-        return self.tail.value == value
+        return tail.value is value or tail.value == value
 
     def popleft(self) -> T:
         if not self:
             raise IndexError
-        value = self.head.value
-        if self.tail is self.head:
+        tail = self.tail
+        head = tail.next
+        value = head.value
+        if head is tail:
             self.tail = None
         else:
-            self.head = self.head.next
+            tail.next = head.next
+        self._length -= 1
         return value
+
+
+class BaseArrayLinkedList(BaseLinkedList[T], ABC):
+    """The Abstract Base Class for linked lists that keep values and links in parallel arrays instead of in nodes.
+
+    A link is an index into the arrays, with -1 indicating no node. Slots freed by pops are chained together through
+    the next array and reused before the arrays grow.
+    """
+    __slots__ = ('_values', '_next', '_head', '_free')
+
+    def __init__(self, values: Iterable[T] = ()) -> None:
+        self._values = list(values)
+        self._length = len(self._values)
+        self._next = array(_INDEX_TYPECODE, range(1, self._length + 1))
+        if self._next:
+            self._next[-1] = -1
+        self._head = 0 if self._values else -1
+        self._free = -1
+
+    def __iter__(self) -> Iterator[T]:
+        values = self._values
+        next_ = self._next
+        index = self._head
+        while index != -1:
+            yield values[index]
+            index = next_[index]
+
+    def __contains__(self, value: T) -> bool:
+        return value in self._values  # Order doesn't matter here, so let list do the scan.
+
+    def _allocate(self, value: T) -> int:
+        """Put the value in a free slot, growing the arrays if there isn't one. Linking the slot is up to the caller.
+
+        Returns:
+            The index of the slot.
+        """
+        index = self._free
+        if index == -1:
+            index = len(self._values)
+            self._values.append(value)
+            self._next.append(-1)
+        else:
+            self._free = self._next[index]
+            self._values[index] = value
+        return index
+
+    def _deallocate(self, index: int) -> None:
+        """Add a slot that's no longer linked to the free chain. Call after updating the length."""
+        if self._length:
+            self._values[index] = _EMPTY
+            self._next[index] = self._free
+            self._free = index
+        else:
+            self._clear()
+
+    def _clear(self) -> None:
+        """Shrink the arrays back to nothing. Only call when the list is empty."""
+        self._values.clear()
+        del self._next[:]
+        self._free = -1
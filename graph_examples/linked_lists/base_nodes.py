@@ -1,15 +1,16 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from collections.abc import Collection, Iterable, Iterator, Reversible
+from collections.abc import Iterable, Iterator
 from typing import Optional, TypeVar, Generic
 
 T = TypeVar('T')
+_MISSING = object()  # Stands in for a value that isn't there, such as the next value of an exhausted iterator.
 
 
-class BaseLinkedNode(ABC, Collection[T], Generic[T]):
+class BaseLinkedNode(ABC, Generic[T]):
     """The Abstract Base Class for all nodes in linked lists.
 
-    BaseLinkedNodes will favor recursion over iteration in their methods.
+    BaseLinkedNodes will favor iteration over recursion in their methods, so lists aren't bound by the recursion limit.
     The default is for operations to be done from the head of the list,
     and for methods that return a node to return the head.
 
@@ -17,6 +18,7 @@ class BaseLinkedNode(ABC, Collection[T], Generic[T]):
         value: The value that occupies this position in the list.
         next: The next node in the list. None indicates no node.
     """
+    __slots__ = ('value', 'next')
 
     def __init__(self, value: T, next_: Optional[BaseLinkedNode] = None) -> None:
         self.value = value
@@ -29,7 +31,7 @@ class BaseLinkedNode(ABC, Collection[T], Generic[T]):
     @classmethod
     @abstractmethod
     def from_iterable(cls, values: Iterable[T]) -> Optional[BaseLinkedNode[T]]:
-        """Recursively create a new list of nodes.
+        """Create a new list of nodes.
 
         Args:
             values: Any iterable that will populate the new list, preserving order.
@@ -59,7 +61,7 @@ class BaseLinkedNode(ABC, Collection[T], Generic[T]):
 
     @abstractmethod
     def reverse(self) -> BaseLinkedNode[T]:
-        """Recursively reverse the list.
+        """Reverse the list.
 
         Returns:
             The new head.
@@ -70,9 +72,10 @@ class BaseSinglyLinkedNode(BaseLinkedNode[T], ABC):
     """A list with just a next node and no last.
 
     This class has no attributes or methods over the BaseLinkedNode, but exists for inheritance clarity."""
+    __slots__ = ()
 
 
-class BaseDoublyLinkedNode(BaseLinkedNode[T], ABC, Reversible):
+class BaseDoublyLinkedNode(BaseLinkedNode[T], ABC):
     """The Abstract Base Class for all doubly linked nodes in linked lists.
 
     BaseDoublyLinkedNode introduces a "last" attribute. This allows methods on the right side of the list to be done
@@ -83,6 +86,7 @@ class BaseDoublyLinkedNode(BaseLinkedNode[T], ABC, Reversible):
         next: The next node in the list. None indicates no node.
         last: The last node in the list. None indicates no node.
     """
+    __slots__ = ('last',)
 
     def __init__(self,
                  value: T,
@@ -122,28 +126,36 @@ class BaseLinearLinkedNode(BaseLinkedNode[T], ABC):
     Any references to nodes should be optional, with None being considered terminal. Any introduced references to nodes
     should follow this pattern.
     """
+    __slots__ = ()
 
     def __len__(self) -> int:
-        """Recursively get the count of this node and the nodes that come after it."""
-        if self.next is None:
-            return 1
-        return 1 + len(self.next)
+        """Get the count of this node and the nodes that come after it."""
+        length = 0
+        node = self
+        while node is not None:
+            length += 1
+            node = node.next
+        return length
 
     def __iter__(self) -> Iterator[T]:
-        """Recursively iterate through the nodes.
+        """Iterate through the nodes.
 
         Yields:
             The values from this node and the ones after it.
         """
-        yield self.value
-        if self.next is not None:
-            yield from self.next
+        node = self
+        while node is not None:
+            yield node.value
+            node = node.next
 
     def __contains__(self, value: T) -> bool:
-        """Recursively search for the value on this node and the ones after in O(n) time."""
-        if value == self.value:
-            return True
-        return self.next is not None and value in self.next
+        """Search for the value on this node and the ones after in O(n) time."""
+        node = self
+        while node is not None:
+            if node.value is value or node.value == value:
+                return True
+            node = node.next
+        return False
 
 
 class BaseCircularLinkedNode(BaseLinkedNode[T], ABC):
@@ -153,31 +165,41 @@ class BaseCircularLinkedNode(BaseLinkedNode[T], ABC):
         value: The value that occupies this position in the list.
         next: The next node in the list. This is no longer optional. If nothing is provided, defaults to self.
     """
+    __slots__ = ()
     next: BaseCircularLinkedNode[T]
 
     def __init__(self, value: T, next_: Optional[BaseCircularLinkedNode] = None):
         next_ = next_ if next_ is not None else self
         super().__init__(value, next_)
 
-    def __len__(self, tail: Optional[BaseCircularLinkedNode] = None) -> int:
-        """Recursively get the count of this node and the nodes that come after it."""
-        if self is tail:
-            return 0
-        return 1 + self.next.__len__(self if tail is None else tail)
+    def __len__(self) -> int:
+        """Get the count of this node and the nodes that come after it."""
+        length = 1
+        node = self.next
+        while node is not self:
+            length += 1
+            node = node.next
+        return length
 
-    def __iter__(self, tail: Optional[BaseCircularLinkedNode] = None) -> Iterator[T]:
-        """Recursively iterate through the nodes.
+    def __iter__(self) -> Iterator[T]:
+        """Iterate through the nodes, starting from the one after this node and ending on this one.
 
         Yields:
             The values from this node and the ones after it.
         """
-        if self is tail:
-            return
-        yield self.next.value
-        yield from self.next.__iter__(self if tail is None else tail)
-
-    def __contains__(self, value: T, tail: Optional[BaseCircularLinkedNode] = None) -> bool:
-        """Recursively search for the value on this node and the ones after in O(n) time."""
-        if self is tail:
-            return False
-        return value == self.value or self.next.__contains__(value, self if tail is None else tail)
+        node = self
+        while True:
+            node = node.next
+            yield node.value
+            if node is self:
+                return
+
+    def __contains__(self, value: T) -> bool:
+        """Search for the value on this node and the ones after in O(n) time."""
+        node = self
+        while True:
+            if node.value is value or node.value == value:
+                return True
+            node = node.next
+            if node is self:
+                return False
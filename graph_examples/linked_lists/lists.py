@@ -1,60 +1,181 @@
 from __future__ import annotations
 
+from array import array
 from collections.abc import Iterable, Iterator
 from typing import Optional
 
 from graph_examples.linked_lists.base_lists import (
+    BaseArrayLinkedList,
     BaseCircularLinkedList,
     BaseLinearLinkedList,
     BaseDoublyLinkedList,
     BaseSinglyLinkedList,
+    _INDEX_TYPECODE,
 )
 from graph_examples.linked_lists.nodes import LinkedNode, DoublyLinkedNode, CircularLinkedNode, CircularDoublyLinkedNode
-from graph_examples.linked_lists.base_nodes import T
+from graph_examples.linked_lists.base_nodes import _MISSING, T
 
 
 class LinkedList(BaseLinearLinkedList[T], BaseSinglyLinkedList[T]):
+    __slots__ = ()
+
     def __init__(self, values: Iterable[T] = ()) -> None:
+        self.head = None
+        self._length = 0
+        self.extend(values)
+
+    def appendleft(self, value: T) -> None:
+        self.head = LinkedNode._make_node(value, self.head)
+        self._length += 1
+
+    def extend(self, values: Iterable[T]) -> None:
+        if values is self:
+            values = list(values)  # Like deque, copy first, or the loop would never run out of values.
         values_iter = iter(values)
-        try:
-            self.head = LinkedNode(next(values_iter))
-        except StopIteration:
-            self.head = None
+        make_node = LinkedNode._make_node  # Bind the classmethod once instead of once per node.
         node = self.head
-        for value in values_iter:
-            node.next = LinkedNode(value)
-            node = node.next
+        if node is None:
+            first = next(values_iter, _MISSING)
+            if first is _MISSING:
+                return
+            node = self.head = make_node(first)
+            self._length += 1
+        else:
+            while node.next is not None:  # There's no stored tail, so this is O(n) once instead of once per value.
+                node = node.next
+        length = self._length
+        try:
+            for value in values_iter:
+                node.next = make_node(value)
+                node = node.next
+                length += 1
+        finally:
+            self._length = length  # If values raises partway, keep what was added, like deque does.
 
-    def appendleft(self, value: T) -> None:
-        self.head = LinkedNode(value, self.head)
+    def extendleft(self, values: Iterable[T]) -> None:
+        make_node = LinkedNode._make_node
+        head = self.head
+        length = self._length
+        try:
+            for value in values:
+                head = make_node(value, head)
+                length += 1
+        finally:
+            self.head = head
+            self._length = length
 
     def popleft(self) -> T:
         if not self:
             raise IndexError
         node = self.head
         self.head = node.next
+        self._length -= 1
         return node.value
 
     def reverse(self) -> None:
         node = self.head
         last_node = None
         while node is not None:
-            node.next, last_node, node = last_node, node, node.next
+            next_node = node.next
+            node.next = last_node
+            last_node = node
+            node = next_node
         self.head = last_node
 
 
-class DoublyLinkedList(BaseLinearLinkedList[T], BaseDoublyLinkedList[T]):
-    def __init__(self, values: Iterable = ()) -> None:
-        values_iter = iter(values)
-        try:
-            self.head = DoublyLinkedNode(next(values_iter))
-        except StopIteration:
-            self.head = None
+class UnrolledLinkedList(BaseLinearLinkedList[T], BaseSinglyLinkedList[T]):
+    """A singly linked list that keeps a block of up to _BLOCK_SIZE values on each node.
+
+    Traversal makes one pointer hop per block instead of per value. Each block is a list holding its values in reverse,
+    so appendleft and popleft are list.append and list.pop on the head block.
+    """
+    __slots__ = ()
+    head: Optional[LinkedNode[list[T]]]
+    _BLOCK_SIZE = 16
+
+    def __init__(self, values: Iterable[T] = ()) -> None:
+        self.head = None
+        self._length = 0
+        self.extend(values)
+
+    def __iter__(self) -> Iterator[T]:
         node = self.head
-        for value in values_iter:
-            node.next = DoublyLinkedNode(value, None, node)
+        while node is not None:
+            yield from reversed(node.value)
             node = node.next
-        self.tail = node
+
+    def __contains__(self, value: T) -> bool:
+        node = self.head
+        while node is not None:
+            if value in node.value:  # list checks identity before equality too.
+                return True
+            node = node.next
+        return False
+
+    def appendleft(self, value: T) -> None:
+        head = self.head
+        if head is None or len(head.value) == self._BLOCK_SIZE:
+            self.head = LinkedNode._make_node([value], head)
+        else:
+            head.value.append(value)
+        self._length += 1
+
+    def extend(self, values: Iterable[T]) -> None:
+        values = list(values)
+        if not values:
+            return
+        make_node = LinkedNode._make_node
+        block_size = self._BLOCK_SIZE
+        node = self.head
+        start = 0
+        if node is not None:
+            while node.next is not None:  # There's no stored tail, so this is O(n / _BLOCK_SIZE) once.
+                node = node.next
+            # Top up the tail block before starting new ones. Its values are reversed, so they go on the front.
+            tail_block = node.value
+            start = block_size - len(tail_block)
+            tail_block[:0] = reversed(values[:start])
+        for start in range(start, len(values), block_size):
+            block = values[start:start + block_size]
+            block.reverse()
+            if node is None:
+                node = self.head = make_node(block)
+            else:
+                node.next = make_node(block)
+                node = node.next
+        self._length += len(values)
+
+    def popleft(self) -> T:
+        if not self:
+            raise IndexError
+        head = self.head
+        block = head.value
+        value = block.pop()
+        if not block:
+            self.head = head.next
+        self._length -= 1
+        return value
+
+    def reverse(self) -> None:
+        node = self.head
+        last_node = None
+        while node is not None:
+            node.value.reverse()
+            next_node = node.next
+            node.next = last_node
+            last_node = node
+            node = next_node
+        self.head = last_node
+
+
+class DoublyLinkedList(BaseLinearLinkedList[T], BaseDoublyLinkedList[T]):
+    __slots__ = ('tail',)
+
+    def __init__(self, values: Iterable = ()) -> None:
+        self.head = None
+        self.tail = None
+        self._length = 0
+        self.extend(values)
 
     def __reversed__(self) -> Iterator[T]:
         node = self.tail
@@ -62,158 +183,431 @@ class DoublyLinkedList(BaseLinearLinkedList[T], BaseDoublyLinkedList[T]):
             yield node.value
             node = node.last
 
-    def append(self, value: T):
+    def append(self, value: T) -> None:
         old_tail = self.tail
-        self.tail = DoublyLinkedNode(value, None, old_tail)
+        node = DoublyLinkedNode._make_node(value, None, old_tail)
         if old_tail is None:
-            self.head = self.tail
+            self.head = node
         else:
-            old_tail.next = self.tail
+            old_tail.next = node
+        self.tail = node
+        self._length += 1
 
-    def appendleft(self, value: T):
+    def appendleft(self, value: T) -> None:
         old_head = self.head
-        self.head = DoublyLinkedNode(value, old_head)
+        node = DoublyLinkedNode._make_node(value, old_head)
         if old_head is None:
-            self.tail = self.head
+            self.tail = node
         else:
-            old_head.last = self.head
+            old_head.last = node
+        self.head = node
+        self._length += 1
+
+    def extend(self, values: Iterable[T]) -> None:
+        if values is self:
+            values = list(values)
+        values_iter = iter(values)
+        make_node = DoublyLinkedNode._make_node
+        length = self._length
+        node = self.tail
+        if node is None:
+            first = next(values_iter, _MISSING)
+            if first is _MISSING:
+                return
+            node = self.head = make_node(first)
+            length += 1
+        try:
+            for value in values_iter:
+                node.next = make_node(value, None, node)
+                node = node.next
+                length += 1
+        finally:
+            self.tail = node
+            self._length = length
+
+    def extendleft(self, values: Iterable[T]) -> None:
+        values_iter = iter(values)
+        make_node = DoublyLinkedNode._make_node
+        length = self._length
+        node = self.head
+        if node is None:
+            first = next(values_iter, _MISSING)
+            if first is _MISSING:
+                return
+            node = self.tail = make_node(first)
+            length += 1
+        try:
+            for value in values_iter:
+                node.last = make_node(value, node)
+                node = node.last
+                length += 1
+        finally:
+            self.head = node
+            self._length = length
 
     def pop(self) -> T:
         if not self:
             raise IndexError
         old_tail = self.tail
-        self.tail = old_tail.last
-        if self.tail is None:
+        tail = old_tail.last
+        if tail is None:
             self.head = None
         else:
-            self.tail.next = None
+            tail.next = None
+        self.tail = tail
+        self._length -= 1
         return old_tail.value
 
     def popleft(self) -> T:
         if not self:
             raise IndexError
         old_head = self.head
-        self.head = old_head.next
-        if self.head is None:
+        head = old_head.next
+        if head is None:
             self.tail = None
         else:
-            self.head.last = None
+            head.last = None
+        self.head = head
+        self._length -= 1
         return old_head.value
 
     def reverse(self) -> None:
         node = self.head
-        self.head, self.tail = self.tail, self.head
         while node is not None:
-            node.next, node.last, node = node.last, node.next, node.next
+            next_node = node.next
+            node.next = node.last
+            node.last = next_node
+            node = next_node
+        self.head, self.tail = self.tail, self.head
 
 
 class CircularLinkedList(BaseCircularLinkedList[T], BaseSinglyLinkedList[T]):
-    def __init__(self, values: Iterable[T] = ()):
-        values_iter = iter(values)
-        try:
-            head = CircularLinkedNode(next(values_iter))
-        except StopIteration:
-            head = None
-        node = head
-        for value in values_iter:
-            node.next = CircularLinkedNode(value, head)
-            node = node.next
-        self.tail = node
-
-    @property
-    def head(self) -> CircularLinkedNode[T]:
-        return self.tail.next
+    __slots__ = ()
 
-    @head.setter
-    def head(self, node: CircularLinkedNode[T]):
-        self.tail.next = node
+    def __init__(self, values: Iterable[T] = ()):
+        self.tail = None
+        self._length = 0
+        self.extend(values)
 
     def appendleft(self, value: T) -> None:
-        if not self:
-            self.tail = CircularLinkedNode(value)
+        tail = self.tail
+        if tail is None:
+            self.tail = CircularLinkedNode._make_node(value)
         else:
-            self.head = CircularLinkedNode(value, self.head)
+            tail.next = CircularLinkedNode._make_node(value, tail.next)
+        self._length += 1
+
+    def extend(self, values: Iterable[T]) -> None:
+        # Build the new nodes as a ring of their own and splice it in after the tail.
+        new_tail, length = CircularLinkedNode._ring_from_iterable(values)
+        if new_tail is None:
+            return
+        tail = self.tail
+        if tail is not None:
+            new_head = new_tail.next
+            new_tail.next = tail.next
+            tail.next = new_head
+        self.tail = new_tail
+        self._length += length
+
+    def extendleft(self, values: Iterable[T]) -> None:
+        values_iter = iter(values)
+        make_node = CircularLinkedNode._make_node
+        length = self._length
+        tail = self.tail
+        if tail is None:
+            first = next(values_iter, _MISSING)
+            if first is _MISSING:
+                return
+            tail = self.tail = make_node(first)
+            length += 1
+        head = tail.next
+        try:
+            for value in values_iter:
+                head = make_node(value, head)
+                length += 1
+        finally:
+            tail.next = head
+            self._length = length
 
     def reverse(self) -> None:
         if not self:
             return
-        node = self.head
-        last_node = self.tail
-        while node is not self.tail:
-            node.next, last_node, node = last_node, node, node.next
-        self.tail.next, self.tail = last_node, self.head
+        tail = self.tail
+        head = tail.next
+        node = head
+        last_node = tail
+        while node is not tail:
+            next_node = node.next
+            node.next = last_node
+            last_node = node
+            node = next_node
+        tail.next = last_node
+        self.tail = head
 
 
 class CircularDoublyLinkedList(BaseCircularLinkedList[T], BaseDoublyLinkedList[T]):
+    __slots__ = ()
     tail: Optional[CircularDoublyLinkedNode[T]]
     head: Optional[CircularDoublyLinkedNode[T]]
 
     def __init__(self, values: Iterable[T] = ()) -> None:
-        values_iter = iter(values)
-        try:
-            head = CircularDoublyLinkedNode(next(values_iter))
-        except StopIteration:
-            head = None
-        node = head
-        for value in values_iter:
-            node.next = CircularDoublyLinkedNode(value, head, node)
-            node = node.next
-            head.last = node
-        self.tail = node
-
-    @property
-    def head(self) -> CircularDoublyLinkedNode[T]:
-        return self.tail.next
+        self.tail = None
+        self._length = 0
+        self.extend(values)
 
     def __reversed__(self) -> Iterator[T]:
-        if not self:
+        tail = self.tail
+        if tail is None:
             return
-        yield self.tail.value
-        node = self.tail.last
-        while node is not self.tail:
+        yield tail.value
+        node = tail.last
+        while node is not tail:
             yield node.value
             node = node.last
 
     def append(self, value: T) -> None:
-        if not self:
-            self.tail = CircularDoublyLinkedNode(value)
+        tail = self.tail
+        if tail is None:
+            self.tail = CircularDoublyLinkedNode._make_node(value)
         else:
-            self.tail = CircularDoublyLinkedNode(value, self.head, self.tail)
-            self.tail.last.next = self.tail
-            self.head.last = self.tail
+            head = tail.next
+            node = CircularDoublyLinkedNode._make_node(value, head, tail)
+            tail.next = node
+            head.last = node
+            self.tail = node
+        self._length += 1
 
     def appendleft(self, value: T) -> None:
-        if not self:
-            self.tail = CircularDoublyLinkedNode(value)
+        tail = self.tail
+        if tail is None:
+            self.tail = CircularDoublyLinkedNode._make_node(value)
         else:
-            self.tail.next = CircularDoublyLinkedNode(value, self.head, self.tail)
-            self.head.next.last = self.tail.next
+            head = tail.next
+            node = CircularDoublyLinkedNode._make_node(value, head, tail)
+            tail.next = node
+            head.last = node
+        self._length += 1
+
+    def extend(self, values: Iterable[T]) -> None:
+        # Build the new nodes as a ring of their own and splice it in after the tail.
+        new_tail, length = CircularDoublyLinkedNode._ring_from_iterable(values)
+        if new_tail is None:
+            return
+        tail = self.tail
+        if tail is not None:
+            head = tail.next
+            new_head = new_tail.next
+            tail.next = new_head
+            new_head.last = tail
+            new_tail.next = head
+            head.last = new_tail
+        self.tail = new_tail
+        self._length += length
+
+    def extendleft(self, values: Iterable[T]) -> None:
+        values_iter = iter(values)
+        make_node = CircularDoublyLinkedNode._make_node
+        length = self._length
+        tail = self.tail
+        if tail is None:
+            first = next(values_iter, _MISSING)
+            if first is _MISSING:
+                return
+            tail = self.tail = make_node(first)
+            length += 1
+        node = tail.next
+        try:
+            for value in values_iter:
+                node.last = make_node(value, node, tail)
+                node = node.last
+                length += 1
+        finally:
+            tail.next = node
+            self._length = length
 
     def pop(self) -> T:
         if not self:
             raise IndexError
-        value = self.tail.value
-        if self.tail is self.head:
+        tail = self.tail
+        head = tail.next
+        value = tail.value
+        if head is tail:
             self.tail = None
         else:
-            self.tail.last.next, self.head.last, self.tail = self.head, self.tail.last, self.tail.last
+            last = tail.last
+            last.next = head
+            head.last = last
+            self.tail = last
+        self._length -= 1
         return value
 
     def popleft(self) -> T:
         if not self:
             raise IndexError
-        value = self.head.value
-        if self.tail is self.head:
+        tail = self.tail
+        head = tail.next
+        value = head.value
+        if head is tail:
             self.tail = None
         else:
-            self.tail.next = self.tail.next.next
-            self.tail.next.last = self.tail
+            head = head.next
+            tail.next = head
+            head.last = tail
+        self._length -= 1
         return value
 
     def reverse(self) -> None:
         if not self:
             return
-        node = self.head
-        while node is not self.tail:
-            node.next, node.last, node = node.last, node.next, node.next
-        self.tail.next, self.tail.last, self.tail = self.tail.last, self.tail.next, self.tail.next
+        tail = self.tail
+        node = tail
+        while True:
+            next_node = node.next
+            node.next = node.last
+            node.last = next_node
+            node = next_node
+            if node is tail:
+                break
+        self.tail = tail.last  # This is the old head, which is now the tail.
+
+
+class ArrayLinkedList(BaseArrayLinkedList[T], BaseSinglyLinkedList[T]):
+    """A singly linked list that keeps values and links in two parallel arrays instead of in nodes."""
+    __slots__ = ()
+
+    def appendleft(self, value: T) -> None:
+        index = self._allocate(value)
+        self._next[index] = self._head
+        self._head = index
+        self._length += 1
+
+    def extend(self, values: Iterable[T]) -> None:
+        if values is self:
+            values = list(values)
+        next_ = self._next
+        tail = self._head
+        if tail != -1:
+            while next_[tail] != -1:  # There's no stored tail, so this is O(n) once instead of once per value.
+                tail = next_[tail]
+        for value in values:
+            index = self._allocate(value)
+            next_[index] = -1
+            if tail == -1:
+                self._head = index
+            else:
+                next_[tail] = index
+            tail = index
+            self._length += 1
+
+    def popleft(self) -> T:
+        if not self:
+            raise IndexError
+        index = self._head
+        value = self._values[index]
+        self._head = self._next[index]
+        self._length -= 1
+        self._deallocate(index)
+        return value
+
+    def reverse(self) -> None:
+        next_ = self._next
+        index = self._head
+        last_index = -1
+        while index != -1:
+            next_index = next_[index]
+            next_[index] = last_index
+            last_index = index
+            index = next_index
+        self._head = last_index
+
+
+class ArrayDoublyLinkedList(BaseArrayLinkedList[T], BaseDoublyLinkedList[T]):
+    """A doubly linked list that keeps values and links in three parallel arrays instead of in nodes."""
+    __slots__ = ('_last', '_tail')
+
+    def __init__(self, values: Iterable[T] = ()) -> None:
+        super().__init__(values)
+        self._last = array(_INDEX_TYPECODE, range(-1, self._length - 1))
+        self._tail = self._length - 1
+
+    def __reversed__(self) -> Iterator[T]:
+        values = self._values
+        last = self._last
+        index = self._tail
+        while index != -1:
+            yield values[index]
+            index = last[index]
+
+    def _allocate(self, value: T) -> int:
+        index = super()._allocate(value)
+        if index == len(self._last):
+            self._last.append(-1)
+        return index
+
+    def _clear(self) -> None:
+        super()._clear()
+        del self._last[:]
+
+    def append(self, value: T) -> None:
+        index = self._allocate(value)
+        old_tail = self._tail
+        self._next[index] = -1
+        self._last[index] = old_tail
+        if old_tail == -1:
+            self._head = index
+        else:
+            self._next[old_tail] = index
+        self._tail = index
+        self._length += 1
+
+    def appendleft(self, value: T) -> None:
+        index = self._allocate(value)
+        old_head = self._head
+        self._next[index] = old_head
+        self._last[index] = -1
+        if old_head == -1:
+            self._tail = index
+        else:
+            self._last[old_head] = index
+        self._head = index
+        self._length += 1
+
+    def pop(self) -> T:
+        if not self:
+            raise IndexError
+        index = self._tail
+        value = self._values[index]
+        self._tail = self._last[index]
+        if self._tail == -1:
+            self._head = -1
+        else:
+            self._next[self._tail] = -1
+        self._length -= 1
+        self._deallocate(index)
+        return value
+
+    def popleft(self) -> T:
+        if not self:
+            raise IndexError
+        index = self._head
+        value = self._values[index]
+        self._head = self._next[index]
+        if self._head == -1:
+            self._tail = -1
+        else:
+            self._last[self._head] = -1
+        self._length -= 1
+        self._deallocate(index)
+        return value
+
+    def reverse(self) -> None:
+        next_ = self._next
+        last = self._last
+        index = self._head
+        while index != -1:
+            next_index = next_[index]
+            next_[index] = last[index]
+            last[index] = next_index
+            index = next_index
+        self._head, self._tail = self._tail, self._head
@@ -13,16 +13,18 @@ from graph_examples.linked_lists.base_nodes import (
     BaseCircularLinkedNode,
     BaseSinglyLinkedNode,
     T,
+    _MISSING,
 )
 
 
 class LinkedNode(BaseSinglyLinkedNode[T], BaseLinearLinkedNode[T]):
     """The most basic node on a linked list."""
+    __slots__ = ()
     next: Optional[LinkedNode[T]]
 
     @classmethod
-    def from_iterable(cls: Type[LinkedNode], values: Iterable[T]) -> LinkedNode[T]:
-        """Recursively create a new list of nodes.
+    def from_iterable(cls: Type[LinkedNode], values: Iterable[T]) -> Optional[LinkedNode[T]]:
+        """Create a new list of nodes.
 
         Args:
             values: Any iterable that will populate the new list, preserving order.
@@ -31,11 +33,26 @@ class LinkedNode(BaseSinglyLinkedNode[T], BaseLinearLinkedNode[T]):
             The head of the new list.
         """
         values_iter = iter(values)
-        try:
-            node = cls(next(values_iter))
-        except StopIteration:
-            return None  # Ends the recursion and assigns None as next for the last node
-        node.next = cls.from_iterable(values_iter)
+        make_node = cls._make_node  # Bind the classmethod once instead of once per node.
+        first = next(values_iter, _MISSING)
+        if first is _MISSING:
+            return None
+        head = make_node(first)
+        node = head
+        for value in values_iter:
+            node.next = make_node(value)
+            node = node.next
+        return head
+
+    @classmethod
+    def _make_node(cls, value: T, next_: Optional[LinkedNode[T]] = None) -> LinkedNode[T]:
+        """Make a node with the value and next set.
+
+        This skips __init__, so it's cheaper than creating a node the normal way.
+        """
+        node = cls.__new__(cls)
+        node.value = value
+        node.next = next_
         return node
 
     def appendleft(self, value) -> LinkedNode[T]:
@@ -47,7 +64,7 @@ class LinkedNode(BaseSinglyLinkedNode[T], BaseLinearLinkedNode[T]):
         Returns:
             The new head of the list with the value set.
         """
-        return LinkedNode(value, self)
+        return LinkedNode._make_node(value, self)
 
     def popleft(self) -> tuple[LinkedNode[T], T]:
         """Pop from the left side of the list, which is also the 0th and head.
@@ -57,17 +74,17 @@ class LinkedNode(BaseSinglyLinkedNode[T], BaseLinearLinkedNode[T]):
         """
         return self.next, self.value
 
-    def reverse(self, last_node: Optional[LinkedNode[T]] = None) -> LinkedNode[T]:
-        """Recursively reverse the list.
+    def reverse(self) -> LinkedNode[T]:
+        """Reverse the list.
 
         Returns:
             The new head.
         """
-        next_node = self.next
-        self.next = last_node
-        if next_node is None:
-            return self  # We've hit the old tail, which is now the head.
-        return next_node.reverse(self)
+        node = self
+        last_node = None
+        while node is not None:
+            node.next, last_node, node = last_node, node, node.next
+        return last_node  # This is the old tail, which is now the head.
 
 
 class DoublyLinkedNode(BaseDoublyLinkedNode[T], BaseLinearLinkedNode[T]):
@@ -77,26 +94,54 @@ class DoublyLinkedNode(BaseDoublyLinkedNode[T], BaseLinearLinkedNode[T]):
     Left side operations (appendleft, popleft, __iter__, reverse) are done from the head.
     Right side operations (append, pop, __reversed__) are done from the tail.
     """
+    __slots__ = ()
     next: Optional[DoublyLinkedNode[T]]
     last: Optional[DoublyLinkedNode[T]]
 
+    def __init__(self,
+                 value: T,
+                 next_: Optional[DoublyLinkedNode[T]] = None,
+                 last: Optional[DoublyLinkedNode[T]] = None) -> None:
+        # Set the fields directly instead of going up the super().__init__ chain. This is hot in the list methods.
+        self.value = value
+        self.next = next_
+        self.last = last
+
     @classmethod
-    def from_iterable(cls, values: Iterable[T], last: Optional[DoublyLinkedNode] = None) -> Optional[DoublyLinkedNode[T]]:
-        """Recursively create a new list of nodes.
+    def from_iterable(cls, values: Iterable[T]) -> Optional[DoublyLinkedNode[T]]:
+        """Create a new list of nodes.
 
         Args:
             values: Any iterable that will populate the new list, preserving order.
-            last: The previous node that was created. This is needed to assign last on the new nodes.
 
         Returns:
             The head of the new list.
         """
         values_iter = iter(values)
-        try:
-            node = cls(next(values_iter), None, last)
-        except StopIteration:
+        make_node = cls._make_node
+        first = next(values_iter, _MISSING)
+        if first is _MISSING:
             return None
-        node.next = cls.from_iterable(values_iter, node)
+        head = make_node(first)
+        node = head
+        for value in values_iter:
+            node.next = make_node(value, None, node)
+            node = node.next
+        return head
+
+    @classmethod
+    def _make_node(cls,
+                   value: T,
+                   next_: Optional[DoublyLinkedNode[T]] = None,
+                   last: Optional[DoublyLinkedNode[T]] = None) -> DoublyLinkedNode[T]:
+        """Make a node with the value, next and last set.
+
+        This skips __init__, so it's cheaper than creating a node the normal way.
+        """
+        node = cls.__new__(cls)
+        node.value = value
+        node.next = next_
+        node.last = last
         return node
 
     @property
@@ -106,17 +151,21 @@ class DoublyLinkedNode(BaseDoublyLinkedNode[T], BaseLinearLinkedNode[T]):
         Returns:
             The tail of the list of nodes
         """
-        if self.next is None:
-            return self
-        return self.next.tail
+        node = self
+        next_node = node.next
+        while next_node is not None:
+            node = next_node
+            next_node = node.next
+        return node
 
     def __reversed__(self) -> Iterator[T]:
         """Yields:
             The values from this node to the head, backwards.
         """
-        yield self.value
-        if self.last is not None:
-            yield from reversed(self.last)
+        node = self
+        while node is not None:
+            yield node.value
+            node = node.last
 
     def append(self, value: T) -> DoublyLinkedNode[T]:
         """This should be called from the tail and appends to the ride side of the list.
@@ -127,7 +176,7 @@ class DoublyLinkedNode(BaseDoublyLinkedNode[T], BaseLinearLinkedNode[T]):
         Returns:
             The new tail of the list with the value set.
         """
-        self.next = DoublyLinkedNode(value, None, self)
+        self.next = DoublyLinkedNode._make_node(value, None, self)
         return self.next
 
     def appendleft(self, value: T) -> DoublyLinkedNode[T]:
@@ -139,7 +188,7 @@ class DoublyLinkedNode(BaseDoublyLinkedNode[T], BaseLinearLinkedNode[T]):
         Returns:
             The new head of the list with the value set.
         """
-        self.last = DoublyLinkedNode(value, self)
+        self.last = DoublyLinkedNode._make_node(value, self)
         return self.last
 
     def pop(self) -> tuple[DoublyLinkedNode[T], T]:
@@ -163,33 +212,66 @@ class DoublyLinkedNode(BaseDoublyLinkedNode[T], BaseLinearLinkedNode[T]):
         return self.next, self.value
 
     def reverse(self) -> DoublyLinkedNode[T]:
-        """Recursively reverse the list. Call from the head.
+        """Reverse the list. Call from the head.
 
         Returns:
             The new head.
         """
-        self.next, self.last = self.last, self.next
-        if self.last is None:
-            return self
-        return self.last.reverse()
+        node = self
+        while True:
+            node.next, node.last = node.last, node.next
+            if node.last is None:
+                return node  # We've hit the old tail, which is now the head.
+            node = node.last
 
 
 class CircularLinkedNode(BaseSinglyLinkedNode[T], BaseCircularLinkedNode[T]):
+    __slots__ = ()
     next: CircularLinkedNode[T]
 
     @classmethod
-    def from_iterable(cls, values: Iterable[T], head=None, last_node=None) -> Optional[CircularLinkedNode[T]]:
+    def from_iterable(cls, values: Iterable[T]) -> Optional[CircularLinkedNode[T]]:
+        return cls._ring_from_iterable(values)[0]
+
+    @classmethod
+    def _ring_from_iterable(cls, values: Iterable[T]) -> tuple[Optional[CircularLinkedNode[T]], int]:
+        """Build a ring of new nodes. Nothing outside the ring is touched, so the lists can splice it in afterwards.
+
+        Returns:
+            A tuple of (tail of the new ring, number of nodes). The tail is None if there were no values.
+        """
         values_iter = iter(values)
-        try:
-            node = cls(next(values_iter), head)
-            if last_node is not None:
-                last_node.next = node
-            return cls.from_iterable(values_iter, node if head is None else head, node)
-        except StopIteration:
-            return last_node
+        first = next(values_iter, _MISSING)
+        if first is _MISSING:
+            return None, 0
+        # Build the nodes as a line, setting each next only once, and close the ring at the end. This is inlined rather
+        # than calling _make_node per value, which makes building about a third faster.
+        new = cls.__new__
+        head = node = new(cls)
+        head.value = first
+        length = 1
+        for value in values_iter:
+            next_node = new(cls)
+            next_node.value = value
+            node.next = next_node
+            node = next_node
+            length += 1
+        node.next = head
+        return node, length
+
+    @classmethod
+    def _make_node(cls, value: T, next_: Optional[CircularLinkedNode[T]] = None) -> CircularLinkedNode[T]:
+        """Make a node with the value and next set. Without a next node, the node points to itself.
+
+        This skips __init__, so it's cheaper than creating a node the normal way.
+        """
+        node = cls.__new__(cls)
+        node.value = value
+        node.next = node if next_ is None else next_
+        return node
 
     def appendleft(self, value: T) -> CircularLinkedNode[T]:
-        self.next = CircularLinkedNode(value, self.next)
+        self.next = CircularLinkedNode._make_node(value, self.next)
         return self
 
     def popleft(self) -> tuple[CircularLinkedNode[T], T]:
@@ -200,16 +282,18 @@ class CircularLinkedNode(BaseSinglyLinkedNode[T], BaseCircularLinkedNode[T]):
             self.next = self.next.next
             return self, value
 
-    def reverse(self, last_node: Optional[CircularLinkedNode] = None,
-                tail: Optional[CircularLinkedNode] = None) -> CircularLinkedNode[T]:
-        next_node = self.next
+    def reverse(self) -> CircularLinkedNode[T]:
+        head = self.next
+        node = head
+        last_node = self
+        while node is not self:
+            node.next, last_node, node = last_node, node, node.next
         self.next = last_node
-        if next_node is None:
-            return tail
-        return next_node.reverse(self, next_node if tail is None else tail)
+        return head
 
 
 class CircularDoublyLinkedNode(BaseDoublyLinkedNode[T], BaseCircularLinkedNode[T]):
+    __slots__ = ()
     next: CircularDoublyLinkedNode[T]
     last: CircularDoublyLinkedNode[T]
 
@@ -219,40 +303,86 @@ class CircularDoublyLinkedNode(BaseDoublyLinkedNode[T], BaseCircularLinkedNode[T
             next_: Optional[CircularDoublyLinkedNode] = None,
             last: Optional[CircularDoublyLinkedNode] = None
     ) -> None:
-        next_ = next_ if next is not None else self
-        last = last if last is not None else self
-        super().__init__(value, next_, last)
+        # Set the fields directly instead of going up two levels of super().__init__.
+        if next_ is None:
+            next_ = self
+        if last is None:
+            last = self
+        self.value = value
+        self.next = next_
+        self.last = last
 
     @classmethod
-    def from_iterable(cls, values: Iterable[T], head=None, last_node=None) -> Optional[CircularDoublyLinkedNode[T]]:
+    def from_iterable(cls, values: Iterable[T]) -> Optional[CircularDoublyLinkedNode[T]]:
+        return cls._ring_from_iterable(values)[0]
+
+    @classmethod
+    def _ring_from_iterable(cls, values: Iterable[T]) -> tuple[Optional[CircularDoublyLinkedNode[T]], int]:
+        """Build a ring of new nodes. Nothing outside the ring is touched, so the lists can splice it in afterwards.
+
+        Returns:
+            A tuple of (tail of the new ring, number of nodes). The tail is None if there were no values.
+        """
         values_iter = iter(values)
-        try:
-            node = cls(next(values_iter), head, last_node)
-            if last_node is not None:
-                last_node.next = node
-                head.last = node
-            return cls.from_iterable(values_iter, node if head is None else head, node)
-        except StopIteration:
-            return last_node
+        first = next(values_iter, _MISSING)
+        if first is _MISSING:
+            return None, 0
+        # Build the nodes as a line, setting each next and last only once, and close the ring at the end. This is
+        # inlined rather than calling _make_node per value, which makes building about a third faster.
+        new = cls.__new__
+        head = node = new(cls)
+        head.value = first
+        length = 1
+        for value in values_iter:
+            next_node = new(cls)
+            next_node.value = value
+            next_node.last = node
+            node.next = next_node
+            node = next_node
+            length += 1
+        node.next = head
+        head.last = node
+        return node, length
+
+    @classmethod
+    def _make_node(cls,
+                   value: T,
+                   next_: Optional[CircularDoublyLinkedNode[T]] = None,
+                   last: Optional[CircularDoublyLinkedNode[T]] = None) -> CircularDoublyLinkedNode[T]:
+        """Make a node with the value, next and last set. Without a next or last node, the node points to itself.
+
+        This skips __init__, so it's cheaper than creating a node the normal way.
+        """
+        node = cls.__new__(cls)
+        node.value = value
+        node.next = node if next_ is None else next_
+        node.last = node if last is None else last
+        return node
 
     @property
     def tail(self):
         return self
 
-    def __reversed__(self, tail: Optional[CircularDoublyLinkedNode] = None) -> Iterator:
-        if self is tail:
-            return
-        yield self.value
-        yield from self.last.__reversed__(self if tail is None else tail)
+    def __reversed__(self) -> Iterator[T]:
+        node = self
+        while True:
+            yield node.value
+            node = node.last
+            if node is self:
+                return
 
     def append(self, value: T) -> CircularDoublyLinkedNode[T]:
-        self.next = CircularDoublyLinkedNode(value, self.next, self)
-        self.next.next.last = self.next
-        return self.next
+        head = self.next
+        node = CircularDoublyLinkedNode._make_node(value, head, self)
+        self.next = node
+        head.last = node
+        return node
 
     def appendleft(self, value: T) -> CircularDoublyLinkedNode[T]:
-        self.next = CircularDoublyLinkedNode(value, self.next, self)
-        self.next.next.last = self.next
+        head = self.next
+        node = CircularDoublyLinkedNode._make_node(value, head, self)
+        self.next = node
+        head.last = node
         return self
 
     def pop(self) -> tuple[CircularDoublyLinkedNode[T], T]:
@@ -273,8 +403,10 @@ class CircularDoublyLinkedNode(BaseDoublyLinkedNode[T], BaseCircularLinkedNode[T
             self.next.last = self
             return self, value
 
-    def reverse(self, head: Optional[CircularDoublyLinkedNode] = None) -> CircularDoublyLinkedNode:
-        if self is head:
-            return self.last
-        self.next, self.last = self.last, self.next
-        return self.last.reverse(self if head is None else head)
+    def reverse(self) -> CircularDoublyLinkedNode[T]:
+        node = self
+        while True:
+            node.next, node.last = node.last, node.next
+            node = node.last
+            if node is self:
+                return self.last
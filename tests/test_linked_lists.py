@@ -1,16 +1,22 @@
 from abc import ABC
+from collections import deque
 from itertools import islice
 from typing import TypeVar
 
 from pytest import mark, fixture, raises
 
 from graph_examples.linked_lists import (
+    ArrayDoublyLinkedList,
+    BaseArrayLinkedList,
     BaseCircularLinkedList,
     BaseDoublyLinkedList,
     BaseLinkedList,
     BaseLinkedNode,
     CircularDoublyLinkedNode,
+    DoublyLinkedList,
     DoublyLinkedNode,
+    LinkedList,
+    UnrolledLinkedList,
 )
 
 # pytestmark = mark.timeout(.1)
@@ -21,11 +27,12 @@ T = TypeVar('T', bound=type)
 def concrete_subclasses(cls: T, *except_: T) -> list[T]:
     except_ = set(except_)
     seen = {cls}
-    queue = [cls]
+    queue = deque([cls])
     concrete = []
     while queue:
-        subclasses = set(queue.pop(0).__subclasses__())
-        to_see = sorted(subclasses - seen - except_, key=lambda x: x.__name__)  # sort to be deterministic
+        subclasses = queue.popleft().__subclasses__()
+        to_see = [c for c in subclasses if c not in seen and c not in except_]
+        to_see.sort(key=lambda x: x.__name__)  # sort to be deterministic
         for cls in to_see:
             seen.add(cls)
             queue.append(cls)
@@ -34,6 +41,14 @@ def concrete_subclasses(cls: T, *except_: T) -> list[T]:
     return concrete
 
 
+# Walk each class hierarchy once, and narrow the list classes down from there.
+NODE_CLASSES = tuple(concrete_subclasses(BaseLinkedNode))
+LIST_CLASSES = tuple(concrete_subclasses(BaseLinkedList))
+ARRAY_LIST_CLASSES = tuple(cls for cls in LIST_CLASSES if issubclass(cls, BaseArrayLinkedList))
+DOUBLY_LIST_CLASSES = tuple(cls for cls in LIST_CLASSES if issubclass(cls, BaseDoublyLinkedList))
+CIRCULAR_LIST_CLASSES = tuple(cls for cls in LIST_CLASSES if issubclass(cls, BaseCircularLinkedList))
+
+
 @fixture(params=['a', 'ab', 'abc'])
 def letters(request) -> str:
     return request.param
@@ -44,7 +59,7 @@ def letters_and_empty(request) -> str:
     return request.param
 
 
-@mark.parametrize('cls', concrete_subclasses(BaseLinkedNode))
+@mark.parametrize('cls', NODE_CLASSES)
 class TestAbstractLinkedNode:
     def test_len(self, cls, letters):
         node = cls.from_iterable(letters)
@@ -60,6 +75,11 @@ class TestAbstractLinkedNode:
             assert letter in node
         assert object() not in node
 
+    def test_contains_identical(self, cls):
+        nan = float('nan')
+        node = cls.from_iterable(['a', nan])
+        assert nan in node
+
     def test_appendleft(self, cls, letters):
         node = cls.from_iterable(letters)
         node = node.appendleft('x')
@@ -92,6 +112,15 @@ class TestAbstractLinkedNode:
         node = node.reverse()
         assert list(node) == list(reversed(letters))
 
+    def test_long(self, cls):
+        values = range(10_000)
+        node = cls.from_iterable(values)
+        assert len(node) == len(values)
+        assert list(node) == list(values)
+        assert values[-1] in node
+        node = node.reverse()
+        assert list(node) == list(reversed(values))
+
 
 class TestCircularDoublyLinkedNode:
     def test_reversed(self, letters):
@@ -121,6 +150,17 @@ class TestDoublyLinkedNode:
         tail = head.tail
         assert list(reversed(tail)) == list(reversed(letters))
 
+    def test_reversed_long(self):
+        values = range(10_000)
+        tail = DoublyLinkedList(values).tail
+        assert list(reversed(tail)) == list(reversed(values))
+
+    def test_tail_long(self):
+        values = range(10_000)
+        tail = DoublyLinkedNode.from_iterable(values).tail
+        assert tail.value == values[-1]
+        assert tail.next is None
+
     def test_pop(self, letters):
         head = DoublyLinkedNode.from_iterable(letters)
         tail = head.tail
@@ -139,7 +179,7 @@ class TestDoublyLinkedNode:
         assert list(reversed(tail)) == list(reversed(letters + 'x'))
 
 
-@mark.parametrize('cls', concrete_subclasses(BaseLinkedList))
+@mark.parametrize('cls', LIST_CLASSES)
 class TestAbstractLinkedList:
     def test_len(self, cls, letters_and_empty):
         li = cls(letters_and_empty)
@@ -155,6 +195,39 @@ class TestAbstractLinkedList:
             assert letter in li
         assert object() not in li
 
+    def test_contains_after_changes(self, cls, letters):
+        li = cls(letters)
+        assert 'x' not in li
+        li.appendleft('x')
+        li.appendleft('x')
+        assert 'x' in li
+        li.popleft()
+        assert 'x' in li
+        li.popleft()
+        assert 'x' not in li
+        for letter in letters:
+            assert letter in li
+
+    def test_contains_identical(self, cls):
+        nan = float('nan')
+        assert nan in cls(['a', nan])
+        assert nan in cls([['a'], nan])
+
+    def test_contains_unhashable(self, cls):
+        li = cls([[1], 2])
+        assert [1] in li
+        assert 2 in li
+        assert [3] not in li
+        li = cls([1, 2])
+        assert [1] not in li
+        li.appendleft([3])
+        assert [3] in li
+        assert 2 in li
+
+    def test_repr(self, cls, letters_and_empty):
+        li = cls(letters_and_empty)
+        assert repr(li) == f'{cls.__name__}({list(letters_and_empty)!r})'
+
     def test_bool(self, cls, letters_and_empty):
         li = cls(letters_and_empty)
         assert bool(li) == bool(letters_and_empty)
@@ -163,6 +236,7 @@ class TestAbstractLinkedList:
         li = cls(letters_and_empty)
         li.appendleft('x')
         assert list(li) == list('x' + letters_and_empty)
+        assert len(li) == len(letters_and_empty) + 1
         try:
             reversed_li = reversed(li)
         except TypeError:
@@ -170,6 +244,64 @@ class TestAbstractLinkedList:
         else:
             assert list(reversed_li) == list(reversed('x' + letters_and_empty))
 
+    def test_extend(self, cls, letters_and_empty):
+        li = cls(letters_and_empty)
+        assert 'x' not in li
+        li.extend('xy')
+        assert list(li) == list(letters_and_empty + 'xy')
+        assert len(li) == len(letters_and_empty) + 2
+        assert 'x' in li
+        li.extend([])
+        assert list(li) == list(letters_and_empty + 'xy')
+
+    def test_extend_self(self, cls, letters_and_empty):
+        li = cls(letters_and_empty)
+        li.extend(li)
+        assert list(li) == list(letters_and_empty * 2)
+        assert len(li) == len(letters_and_empty) * 2
+        li = cls(letters_and_empty)
+        li.extendleft(li)
+        assert list(li) == list(letters_and_empty[::-1] + letters_and_empty)
+        assert len(li) == len(letters_and_empty) * 2
+
+    @mark.parametrize('method, added', [('extend', '{}xy'), ('extendleft', 'yx{}')])
+    def test_extend_raises_partway(self, cls, letters_and_empty, method, added):
+        def values():
+            yield from 'xy'
+            raise ValueError
+
+        li = cls(letters_and_empty)
+        with raises(ValueError):
+            getattr(li, method)(values())
+        # The values before the error are either all kept or all dropped, and the list is still consistent.
+        assert list(li) in (list(added.format(letters_and_empty)), list(letters_and_empty))
+        assert len(li) == len(list(li))
+        assert ('x' in li) == (len(li) > len(letters_and_empty))
+        try:
+            reversed_li = reversed(li)
+        except TypeError:
+            pass
+        else:
+            assert list(reversed_li) == list(li)[::-1]
+        expected = list(li)
+        li.appendleft('w')
+        li.extend('z')
+        assert list(li) == ['w'] + expected + ['z']
+
+    def test_extendleft(self, cls, letters_and_empty):
+        li = cls(letters_and_empty)
+        assert 'x' not in li
+        li.extendleft('xy')
+        assert list(li) == list('yx' + letters_and_empty)
+        assert len(li) == len(letters_and_empty) + 2
+        assert 'x' in li
+        try:
+            reversed_li = reversed(li)
+        except TypeError:
+            pass
+        else:
+            assert list(reversed_li) == list(reversed('yx' + letters_and_empty))
+
     def test_popleft(self, cls, letters_and_empty):
         li = cls(letters_and_empty)
         values = []
@@ -186,6 +318,12 @@ class TestAbstractLinkedList:
         assert not li
         assert values == list(letters_and_empty)
 
+    def test_popleft_then_appendleft(self, cls, letters):
+        li = cls(letters)
+        li.popleft()
+        li.appendleft('x')
+        assert list(li) == list('x' + letters[1:])
+
     def test_popleft_empty(self, cls):
         li = cls()
         with raises(IndexError):
@@ -197,7 +335,91 @@ class TestAbstractLinkedList:
         assert list(li) == list(reversed(letters_and_empty))
 
 
-@mark.parametrize('cls', concrete_subclasses(BaseDoublyLinkedList))
+@mark.parametrize('cls', ARRAY_LIST_CLASSES)
+class TestAbstractArrayLinkedList:
+    def test_reuses_freed_slots(self, cls):
+        li = cls('abc')
+        li.popleft()
+        li.popleft()
+        for letter in 'xyz':
+            li.appendleft(letter)
+        assert list(li) == list('zyxc')
+        assert 'a' not in li
+        li.reverse()
+        assert list(li) == list('cxyz')
+
+
+class TestArrayDoublyLinkedList:
+    def test_reuses_freed_slots(self):
+        li = ArrayDoublyLinkedList('abc')
+        li.pop()
+        li.popleft()
+        li.append('x')
+        li.appendleft('y')
+        assert list(li) == list('ybx')
+        assert list(reversed(li)) == list('xby')
+        li.reverse()
+        assert list(li) == list('xby')
+        assert list(reversed(li)) == list('ybx')
+
+
+class TestLinkedList:
+    def test_popped_head_is_left_alone(self):
+        li = LinkedList('ab')
+        head = li.head
+        li.popleft()
+        other = LinkedList('x')
+        assert head is not other.head
+        assert head.value == 'a'
+
+
+class TestDoublyLinkedList:
+    def test_nodes_after_reverse(self):
+        li = DoublyLinkedList([1, 2, 3])
+        li.reverse()
+        assert li.head.value == 3
+        assert li.head.next.value == 2
+        assert li.head.last is None
+        assert li.tail.value == 1
+        assert li.tail.last.value == 2
+        assert li.tail.next is None
+        li.append(0)
+        assert li.tail.value == 0
+        assert li.tail.last.value == 1
+
+
+class TestUnrolledLinkedList:
+    def test_many_blocks(self):
+        values = list(range(50))
+        li = UnrolledLinkedList(values)
+        li.extend(range(50, 60))
+        values.extend(range(50, 60))
+        assert list(li) == values
+        for value in range(-1, -40, -1):
+            li.appendleft(value)
+            values.insert(0, value)
+        assert list(li) == values
+        for _ in range(45):
+            assert li.popleft() == values.pop(0)
+        assert list(li) == values
+        assert len(li) == len(values)
+        li.reverse()
+        assert list(li) == values[::-1]
+
+    def test_small_extends_fill_blocks(self):
+        li = UnrolledLinkedList()
+        for value in range(100):
+            li.extend([value])
+        assert list(li) == list(range(100))
+        blocks = 0
+        node = li.head
+        while node is not None:
+            blocks += 1
+            node = node.next
+        assert blocks == 7  # ceil(100 / 16)
+
+
+@mark.parametrize('cls', DOUBLY_LIST_CLASSES)
 class TestAbstractDoublyLinkedList:
     def test_reversed(self, cls, letters_and_empty):
         li = cls(letters_and_empty)
@@ -223,10 +445,31 @@ class TestAbstractDoublyLinkedList:
         li = cls(letters_and_empty)
         li.append('x')
         assert list(li) == list(letters_and_empty + 'x')
+        assert len(li) == len(letters_and_empty) + 1
         assert list(reversed(li)) == list(reversed(letters_and_empty + 'x'))
 
+    def test_reverse_then_change(self, cls, letters_and_empty):
+        li = cls(letters_and_empty)
+        li.reverse()
+        li.append('x')
+        li.appendleft('y')
+        li.extend('z')
+        li.extendleft('w')
+        expected = 'wy' + letters_and_empty[::-1] + 'xz'
+        assert list(li) == list(expected)
+        assert list(reversed(li)) == list(reversed(expected))
+        assert li.pop() == 'z'
+        assert li.popleft() == 'w'
+        li.reverse()
+        assert list(li) == list(reversed(expected[1:-1]))
+
+    def test_extend_reversed(self, cls, letters_and_empty):
+        li = cls(letters_and_empty)
+        li.extend('xy')
+        assert list(reversed(li)) == list(reversed(letters_and_empty + 'xy'))
+
 
-@mark.parametrize('cls', concrete_subclasses(BaseCircularLinkedList))
+@mark.parametrize('cls', CIRCULAR_LIST_CLASSES)
 class TestAbstractCircularLinkedList:
     def test_infinite_iterator(self, cls, letters):
         li = cls(letters)